@@ -183,10 +183,10 @@ if st.button("🚀 Run Analysis"):
     r0 = b_height / b_depth; res0 = wind_load.solve_cpe_for_ratio(roof_angle, roof_type, r0)
     r90 = b_height / b_width; res90 = wind_load.solve_cpe_for_ratio(roof_angle, roof_type, r90)
     
-    if res0['cpe'] < res90['cpe']:
-        base_cpe, gov_case, note = res0['cpe'], f"Wind 0° (Normal) | h/d={r0:.2f}", "Wind 0° is critical"
+    if res0.cpe < res90.cpe:
+        base_cpe, gov_case, note = res0.cpe, f"Wind 0° (Normal) | h/d={r0:.2f}", "Wind 0° is critical"
     else:
-        base_cpe, gov_case, note = res90['cpe'], f"Wind 90° (Parallel) | h/b={r90:.2f}", "Wind 90° is critical"
+        base_cpe, gov_case, note = res90.cpe, f"Wind 90° (Parallel) | h/b={r90:.2f}", "Wind 90° is critical"
 
     zones = [{"code": "RA1", "desc": "General", "kl": 1.0}, {"code": "RA2", "desc": "Edges", "kl": 1.5}, 
              {"code": "RA3", "desc": "Corners", "kl": 2.0}, {"code": "RA4", "desc": "High Suction", "kl": 3.0}]
@@ -195,8 +195,10 @@ if st.button("🚀 Run Analysis"):
     worst_res = None
     max_mag_p = -1.0
     
-    for z in zones:
-        p_z = wind_load.calculate_wind_pressure(v_des, base_cpe, ka, kc, z['kl'])
+    # Kl is the only per-zone factor: evaluate all zone pressures in one call
+    p_zones = wind_load.calculate_wind_pressure(v_des, base_cpe, ka, kc, np.array([z['kl'] for z in zones]))
+    
+    for z, p_z in zip(zones, p_zones):
         w_z = p_z * trib_width
         
         span, fem, history = structural.optimize_span(Mn, w_z, num_spans, max_span=4.0, clamp_capacity=clamp_cap)
@@ -275,8 +277,8 @@ if 'has_run' in st.session_state and st.session_state['has_run']:
         c_wind1, c_wind2 = st.columns([1, 1])
         with c_wind1:
             st.markdown(f"**Governing:** {w_dat['gov_case']}")
-            st.write(f"- Cpe (Normal): {w_dat['res0']['cpe']:.2f}")
-            st.write(f"- Cpe (Parallel): {w_dat['res90']['cpe']:.2f}")
+            st.write(f"- Cpe (Normal): {w_dat['res0'].cpe:.2f}")
+            st.write(f"- Cpe (Parallel): {w_dat['res90'].cpe:.2f}")
             st.write(f"- **Base Cpe:** {w_dat['base_cpe']:.2f}")
         with c_wind2:
             st.pyplot(plot_panel_load(panel_w, panel_d, orient_key, w_dat['trib_width']))
@@ -325,7 +327,7 @@ if 'has_run' in st.session_state and st.session_state['has_run']:
             'panel_w': panel_w, 'panel_d': panel_d, 'num_spans': num_spans, 'clamp_cap': clamp_cap
         }
         w_d = {
-            'cpe_0': w_dat['res0']['cpe'], 'ratio_0': w_dat['r0'], 'cpe_90': w_dat['res90']['cpe'], 'ratio_90': w_dat['r90'],
+            'cpe_0': w_dat['res0'].cpe, 'ratio_0': w_dat['r0'], 'cpe_90': w_dat['res90'].cpe, 'ratio_90': w_dat['r90'],
             'governing_case': w_dat['gov_case'], 'note': w_dat['note'], 'trib_width': w_dat['trib_width'], 'ka': ka, 'kc': kc, 'cpe_base': w_dat['base_cpe']
         }
         
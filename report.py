@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import datetime
-from fpdf import FPDF
+from fpdf import FPDF, XPos, YPos
 
 # ==========================================
 # ASCII ART ASSETS
@@ -102,10 +102,9 @@ def format_iteration_table(history, zone_name):
 def generate_full_report(inputs, wind_res, struct_res, zone_results, critical_res):
     
     # 1. Format Tables (Use Data Passed Directly)
-    df_res = pd.DataFrame(zone_results)
-    
-    # Remove large object columns for display
-    df_clean = df_res.drop(columns=['history'], errors='ignore')
+    # Leave out large object columns (history) before the frame is built
+    rows = [{k: v for k, v in z.items() if k != 'history'} for z in zone_results]
+    df_clean = pd.DataFrame(rows)
     
     # Ensure 'Util Ratio' is displayed correctly if passed from app.py
     # Note: We rely on 'Util Ratio' calculated in app.py logic
@@ -113,16 +112,17 @@ def generate_full_report(inputs, wind_res, struct_res, zone_results, critical_re
     table_str = df_clean.to_string(index=False, justify="right", float_format=lambda x: "{:.3f}".format(x) if isinstance(x, (float, np.floating)) else str(x))
     
     # 2. Iteration Logs
-    iteration_logs = ""
-    for z in zone_results:
-        hist = z.get('history', [])
-        iteration_logs += format_iteration_table(hist, z.get('Zone', 'Unknown')) + "\n"
+    iteration_logs = "".join(
+        format_iteration_table(z.get('history', []), z.get('Zone', 'Unknown')) + "\n"
+        for z in zone_results
+    )
 
     # 3. Visuals
     ridge_art = get_ascii_ridge_diagram(inputs['b_width'], inputs['b_depth'], inputs['roof_type'])
-    zone_art = ""
-    for z in zone_results:
-        zone_art += f"\n   ZONE {z.get('Zone')} ({z.get('Description')}):\n" + get_ascii_art(z.get('Zone'))
+    zone_art = "".join(
+        f"\n   ZONE {z.get('Zone')} ({z.get('Description')}):\n" + get_ascii_art(z.get('Zone'))
+        for z in zone_results
+    )
 
     current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logo = get_report_logo()
@@ -277,6 +277,14 @@ def create_pdf_report(report_string):
     pdf.add_page()
     pdf.set_font("Courier", size=8)
     safe_text = report_string.encode('latin-1', 'replace').decode('latin-1')
-    pdf.multi_cell(0, 4, safe_text)
+
+    # Text is pre-formatted in monospace: write line by line and only let
+    # FPDF wrap lines that overrun the page (e.g. the logo)
+    max_chars = int((pdf.epw - 2 * pdf.c_margin) // pdf.get_string_width(" "))
+    for line in safe_text.split("\n"):
+        if len(line) <= max_chars:
+            pdf.cell(0, 4, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        else:
+            pdf.multi_cell(0, 4, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     return bytes(pdf.output())
 
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 
 def calculate_Mn(breaking_load_kn, test_span_m, safety_factor=1.0):
     """
@@ -8,13 +9,13 @@ def calculate_Mn(breaking_load_kn, test_span_m, safety_factor=1.0):
     mn_test = (breaking_load_kn * test_span_m) / 4.0
     return mn_test / safety_factor
 
-def solve_continuous_beam_exact(span_length, num_spans, w_load):
+@lru_cache(maxsize=None)
+def _unit_solution(num_spans):
     """
-    Engine: Solves Indeterminate Continuous Beam using Matrix Method.
-    Returns exact arrays for x, shear(V), moment(M), and reactions(R).
+    Dimensionless solution of the continuous beam (w = 1, L = 1).
+    Moments scale with w*L^2, shears/reactions with w*L and x with L,
+    so one solve per num_spans serves every span and load.
     """
-    L = span_length
-    w = w_load
     n_supports = num_spans + 1
     
     # 1. Solve for Support Moments (M)
@@ -22,65 +23,100 @@ def solve_continuous_beam_exact(span_length, num_spans, w_load):
         M_supports = np.array([0.0, 0.0])
     else:
         n_internal = num_spans - 1
-        A = np.zeros((n_internal, n_internal))
-        for i in range(n_internal):
-            A[i, i] = 4.0
-            if i > 0: A[i, i-1] = 1.0
-            if i < n_internal - 1: A[i, i+1] = 1.0
-        B = np.full(n_internal, -0.5 * w * L**2)
-        
-        if n_internal > 0:
-            M_internal = np.linalg.solve(A, B)
-            M_supports = np.concatenate(([0], M_internal, [0]))
-        else:
-            M_supports = np.zeros(n_supports)
+        # Three-moment equations: tridiagonal (1, 4, 1) - Thomas algorithm
+        a = np.ones(n_internal)
+        b = np.full(n_internal, 4.0)
+        c = np.ones(n_internal)
+        d = np.full(n_internal, -0.5)
+
+        # Forward sweep
+        for i in range(1, n_internal):
+            m = a[i] / b[i-1]
+            b[i] -= m * c[i-1]
+            d[i] -= m * d[i-1]
+
+        # Back substitution
+        M_internal = np.empty(n_internal)
+        M_internal[-1] = d[-1] / b[-1]
+        for i in range(n_internal - 2, -1, -1):
+            M_internal[i] = (d[i] - c[i] * M_internal[i+1]) / b[i]
+
+        M_supports = np.concatenate(([0], M_internal, [0]))
 
     # 2. Calculate Reactions (R) & Shears
+    V_right = 0.5 - M_supports[:-1] + M_supports[1:]
+    V_left = 1.0 - V_right
+
     R = np.zeros(n_supports)
-    V_right = np.zeros(num_spans)
-    V_left = np.zeros(num_spans)
-    
-    for i in range(num_spans):
-        V_right[i] = (w * L**2 / 2 - M_supports[i] + M_supports[i+1]) / L
-        V_left[i] = w * L - V_right[i]
-        
     R[0] = V_right[0]
     R[-1] = V_left[-1]
-    for i in range(1, num_spans):
-        R[i] = V_left[i-1] + V_right[i]
+    R[1:-1] = V_left[:-1] + V_right[1:]
+
+    # 3. Peak Values (closed form)
+    # Moment is parabolic in each span: peak where shear V(x) = V_right - x = 0
+    x_peak = np.clip(V_right, 0.0, 1.0)
+    m_peak = M_supports[:-1] + V_right * x_peak - 0.5 * x_peak**2
+    max_moment = max(np.max(np.abs(m_peak)), np.max(np.abs(M_supports)))
+    # Shear is linear in each span: peak at the span ends
+    max_shear = max(np.max(np.abs(V_right)), np.max(np.abs(V_left)))
 
-    # 3. Generate Plotting Data
+    # 4. Generate Plotting Data - one (num_spans, points_per_span) grid
     points_per_span = 50
-    x_plot = []
-    shear_plot = []
-    moment_plot = []
-    
-    for i in range(num_spans):
-        x_local = np.linspace(0, L, points_per_span)
-        v_local = V_right[i] - w * x_local
-        m_local = M_supports[i] + V_right[i] * x_local - (w * x_local**2) / 2
-        x_global = x_local + i * L
-        
-        x_plot.extend(x_global)
-        shear_plot.extend(v_local)
-        moment_plot.extend(m_local)
 
-    m_arr = np.array(moment_plot)
-    v_arr = np.array(shear_plot)
+    # Equal spans share the same local stations
+    x_local = np.linspace(0, 1, points_per_span)[None, :]
+    offsets = np.arange(num_spans)[:, None]
+    Vr = V_right[:, None]
+    Ms = M_supports[:-1, None]
 
-    max_reaction_magnitude = np.max(np.abs(R))
+    x_grid = x_local + offsets
+    v_grid = Vr - x_local
+    m_grid = Ms + Vr * x_local - 0.5 * x_local**2
 
-    return {
-        'max_moment': np.max(np.abs(m_arr)), 
-        'max_shear': np.max(np.abs(v_arr)),  
-        'moment_array': m_arr,
-        'shear_array': v_arr,
-        'x_array': np.array(x_plot),
+    unit = {
+        'max_moment': max_moment,
+        'max_shear': max_shear,
         'reactions': R,
         'rxn_edge': np.abs(R[0]),
         'rxn_internal': np.max(np.abs(R[1:-1])) if len(R) > 2 else (np.abs(R[0]) if len(R)==2 else 0),
-        'rxn_max': max_reaction_magnitude
+        'rxn_max': np.max(np.abs(R)),
+        'moment_array': m_grid.ravel(),
+        'shear_array': v_grid.ravel(),
+        'x_array': x_grid.ravel()
+    }
+    # Shared by every caller - guard against in-place edits
+    for key in ('reactions', 'moment_array', 'shear_array', 'x_array'):
+        unit[key].setflags(write=False)
+    return unit
+
+def solve_continuous_beam_exact(span_length, num_spans, w_load):
+    """
+    Engine: Continuous beam results for one span length and load.
+    Scales the cached dimensionless solution (_unit_solution) by w and L.
+    Returns peak values, reactions(R) and float32 diagram arrays for x, shear(V), moment(M).
+    """
+    L = span_length
+    w = w_load
+    unit = _unit_solution(num_spans)
+
+    # Scale the dimensionless solution (magnitudes use |w|, load may be suction)
+    wL = w * L
+    wL2 = wL * L
+    abs_wL = abs(wL)
+
+    res = {
+        'max_moment': unit['max_moment'] * abs(wL2),
+        'max_shear': unit['max_shear'] * abs_wL,
+        'reactions': unit['reactions'] * wL,
+        'rxn_edge': unit['rxn_edge'] * abs_wL,
+        'rxn_internal': unit['rxn_internal'] * abs_wL,
+        'rxn_max': unit['rxn_max'] * abs_wL
     }
+    # Plot arrays only feed the diagrams - float32 is plenty
+    res['moment_array'] = np.multiply(unit['moment_array'], wL2, dtype=np.float32)
+    res['shear_array'] = np.multiply(unit['shear_array'], wL, dtype=np.float32)
+    res['x_array'] = np.multiply(unit['x_array'], L, dtype=np.float32)
+    return res
 
 def optimize_span(Mn, w_load, num_spans, max_span=4.0, clamp_capacity=None):
     """
@@ -89,59 +125,52 @@ def optimize_span(Mn, w_load, num_spans, max_span=4.0, clamp_capacity=None):
     """
     step = 0.05
     min_span = 0.10 
-    current_span = min_span
+    # Integer step count - accumulating `+= step` drifts off the 0.05 m grid.
+    # Floor (with a tolerance for 3.9 / 0.05 = 77.999...) so no span exceeds max_span
+    n_steps = max(int(np.floor((max_span - min_span) / step + 1e-9)) + 1, 0)
+    # ...and clamp, since min_span + k*step can land 1 ulp above it
+    spans = np.minimum(min_span + step * np.arange(n_steps), max_span)
+
+    # Demands follow from the dimensionless solution:
+    # M* = k_m * L^2 and R* = k_r * L - evaluated over the whole grid at once
+    unit = _unit_solution(num_spans)
+    # Grouped as in solve_continuous_beam_exact so the logged span matches its fem bit for bit
+    m_star = unit['max_moment'] * np.abs(w_load * spans * spans)  # Demand (Rail)
+    r_star = unit['rxn_max'] * np.abs(w_load * spans)             # Demand (Clamp) - Absolute Magnitude
     
-    history = []
-    valid_span = min_span
-    final_fem = None
+    # --- UTILIZATION RATIO CALCULATION (Demand / Capacity) ---
     
-    # Pre-calculate at min_span
-    final_fem = solve_continuous_beam_exact(min_span, num_spans, w_load)
+    # 1. Rail Utilization (M* / Mn)
+    ratio_rail = m_star / Mn
     
-    while current_span <= max_span:
-        fem = solve_continuous_beam_exact(current_span, num_spans, w_load)
-        
-        m_star = fem['max_moment']  # Demand (Rail)
-        r_star = fem['rxn_max']     # Demand (Clamp) - Absolute Magnitude
-        
-        # --- UTILIZATION RATIO CALCULATION (Demand / Capacity) ---
-        
-        # 1. Rail Utilization (M* / Mn)
-        ratio_rail = m_star / Mn
+    # 2. Clamp Utilization (R* / R_cap)
+    ratio_clamp = np.zeros(n_steps)
+    if clamp_capacity is not None and clamp_capacity > 0:
+        ratio_clamp = r_star / clamp_capacity
         
-        # 2. Clamp Utilization (R* / R_cap)
-        ratio_clamp = 0.0
-        if clamp_capacity is not None and clamp_capacity > 0:
-            ratio_clamp = r_star / clamp_capacity
-            
-        # Determine Status
-        is_safe = (ratio_rail <= 1.0) and (ratio_clamp <= 1.0)
-        
-        limit_mode = "Rail" # Default
-        max_ratio = ratio_rail
-        
-        # Identify governing factor
-        if ratio_clamp > ratio_rail:
-            limit_mode = "Clamp"
-            max_ratio = ratio_clamp
-        
-        status = "OK" if is_safe else "Unsafe"
-            
-        history.append({
-            'span': current_span,
-            'm_star': m_star,
-            'r_star': r_star,
-            'max_ratio': max_ratio,     # The governing ratio (Decimal)
-            'limit_mode': limit_mode,
-            'status': status
-        })
-        
-        if is_safe:
-            valid_span = current_span
-            final_fem = fem
-        else:
-            break
-            
-        current_span += step
+    # Determine Status
+    is_safe = (ratio_rail <= 1.0) & (ratio_clamp <= 1.0)
+    
+    # Identify governing factor
+    clamp_governs = ratio_clamp > ratio_rail
+    max_ratio = np.where(clamp_governs, ratio_clamp, ratio_rail)
+
+    # The sweep stops at the first unsafe span (logged, then rejected)
+    unsafe = np.flatnonzero(~is_safe)
+    n_safe = int(unsafe[0]) if unsafe.size else n_steps
+    n_logged = min(n_safe + 1, n_steps)
+    valid_span = float(spans[n_safe - 1]) if n_safe > 0 else min_span
+
+    final_fem = solve_continuous_beam_exact(valid_span, num_spans, w_load)
+
+    # max_ratio is the governing ratio (Decimal)
+    history = [
+        {'span': sp, 'm_star': ms, 'r_star': rs, 'max_ratio': mr,
+         'limit_mode': "Clamp" if cg else "Rail", 'status': "OK" if ok else "Unsafe"}
+        for sp, ms, rs, mr, cg, ok in zip(
+            spans[:n_logged].tolist(), m_star[:n_logged].tolist(), r_star[:n_logged].tolist(),
+            max_ratio[:n_logged].tolist(), clamp_governs[:n_logged].tolist(), is_safe[:n_logged].tolist()
+        )
+    ]
 
     return valid_span, final_fem, history
@@ -1,56 +1,89 @@
 import math
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+import numpy as np
 
 # =============================================================================================
 # 1. ฐานข้อมูลความเร็วลม (Wind Speed Data) - AS/NZS 1170.2 (UPDATED)
 # =============================================================================================
-WIND_DATA = {
-    # --- Australia Regions (Non-cyclonic) ---
-    "A0": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-    "A1": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-    "A2": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-    "A3": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-    "A4": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-    "A5": {1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51},
-
-    "B1": {1: 26, 5: 28, 10: 33, 20: 38, 25: 39, 50: 44, 100: 48, 200: 52, 250: 53, 500: 57, 1000: 60, 2000: 63, 2500: 64, 5000: 67, 10000: 69},
-    "B2": {1: 26, 5: 28, 10: 33, 20: 38, 25: 39, 50: 44, 100: 48, 200: 52, 250: 53, 500: 57, 1000: 60, 2000: 63, 2500: 64, 5000: 67, 10000: 69},
+# Distinct speed profiles {R: Vr} - read-only, the look-ups are memoized
+_WIND_PROFILES = {
+    "A":    MappingProxyType({1: 30, 5: 32, 10: 34, 20: 37, 25: 37, 50: 39, 100: 41, 200: 43, 250: 43, 500: 45, 1000: 46, 2000: 48, 2500: 48, 5000: 50, 10000: 51}),
+    "B":    MappingProxyType({1: 26, 5: 28, 10: 33, 20: 38, 25: 39, 50: 44, 100: 48, 200: 52, 250: 53, 500: 57, 1000: 60, 2000: 63, 2500: 64, 5000: 67, 10000: 69}),
+    "C":    MappingProxyType({1: 23, 5: 33, 10: 39, 20: 45, 25: 47, 50: 52, 100: 56, 200: 61, 250: 62, 500: 66, 1000: 70, 2000: 73, 2500: 74, 5000: 78, 10000: 81}),
+    "D":    MappingProxyType({1: 23, 5: 35, 10: 43, 20: 51, 25: 53, 50: 60, 100: 66, 200: 72, 250: 74, 500: 80, 1000: 85, 2000: 90, 2500: 91, 5000: 95, 10000: 99}),
+    "NZ12": MappingProxyType({1: 31, 5: 35, 10: 37, 20: 39, 25: 39, 50: 41, 100: 42, 200: 43, 250: 44, 500: 45, 1000: 46, 2000: 47, 2500: 47, 5000: 48, 10000: 49}),
+    "NZ3":  MappingProxyType({1: 37, 5: 42, 10: 44, 20: 46, 25: 46, 50: 48, 100: 50, 200: 51, 250: 51, 500: 53, 1000: 54, 2000: 55, 2500: 55, 5000: 56, 10000: 57}),
+    "NZ4":  MappingProxyType({1: 38, 5: 42, 10: 43, 20: 44, 25: 45, 50: 46, 100: 47, 200: 48, 250: 49, 500: 50, 1000: 50, 2000: 51, 2500: 52, 5000: 52, 10000: 53}),
+}
 
-    "C":  {1: 23, 5: 33, 10: 39, 20: 45, 25: 47, 50: 52, 100: 56, 200: 61, 250: 62, 500: 66, 1000: 70, 2000: 73, 2500: 74, 5000: 78, 10000: 81},
-    "D":  {1: 23, 5: 35, 10: 43, 20: 51, 25: 53, 50: 60, 100: 66, 200: 72, 250: 74, 500: 80, 1000: 85, 2000: 90, 2500: 91, 5000: 95, 10000: 99},
+# Wind region -> speed profile
+_WIND_ALIAS = {
+    # --- Australia Regions (Non-cyclonic) ---
+    "A0": "A", "A1": "A", "A2": "A", "A3": "A", "A4": "A", "A5": "A",
+    "B1": "B", "B2": "B",
+    "C": "C", "D": "D",
 
     # --- New Zealand Regions ---
-    "NZ1": {1: 31, 5: 35, 10: 37, 20: 39, 25: 39, 50: 41, 100: 42, 200: 43, 250: 44, 500: 45, 1000: 46, 2000: 47, 2500: 47, 5000: 48, 10000: 49},
-    "NZ2": {1: 31, 5: 35, 10: 37, 20: 39, 25: 39, 50: 41, 100: 42, 200: 43, 250: 44, 500: 45, 1000: 46, 2000: 47, 2500: 47, 5000: 48, 10000: 49},
-    "NZ3": {1: 37, 5: 42, 10: 44, 20: 46, 25: 46, 50: 48, 100: 50, 200: 51, 250: 51, 500: 53, 1000: 54, 2000: 55, 2500: 55, 5000: 56, 10000: 57},
-    "NZ4": {1: 38, 5: 42, 10: 43, 20: 44, 25: 45, 50: 46, 100: 47, 200: 48, 250: 49, 500: 50, 1000: 50, 2000: 51, 2500: 52, 5000: 52, 10000: 53}
+    "NZ1": "NZ12", "NZ2": "NZ12", "NZ3": "NZ3", "NZ4": "NZ4",
 }
 
+WIND_DATA = MappingProxyType({region: _WIND_PROFILES[p] for region, p in _WIND_ALIAS.items()})
+
+# Every profile is tabulated at the same return periods: one shared (sorted) R axis
+# and one contiguous Vr table, a row per profile, built once for searchsorted.
+# Vr is tabulated in whole m/s, so float32 holds it exactly at half the size.
+_WIND_R = np.array(sorted(_WIND_PROFILES["A"]))
+_WIND_VR_TABLE = np.array([[data[r] for r in _WIND_R] for data in _WIND_PROFILES.values()], dtype=np.float32)
+_WIND_R.setflags(write=False)
+_WIND_VR_TABLE.setflags(write=False)
+_REGION_ROW = {region: list(_WIND_PROFILES).index(p) for region, p in _WIND_ALIAS.items()}
+# Plain-tuple copies for the scalar look-up - bisect on a tuple skips NumPy dispatch
+_WIND_R_TUPLE = tuple(_WIND_R.tolist())
+_WIND_VR_ROWS = tuple(tuple(row) for row in _WIND_VR_TABLE.tolist())
+
+# Annual return period R: row = importance level, column = design life
+_IL_ROW = {1: 0, 2: 1, 3: 2, 4: 3}
+_DESIGN_LIFE_COL = {5: 0, 25: 1, 50: 2, 100: 3}
+_RETURN_PERIOD_TABLE = (
+    # Life: 5    25    50    100 yr
+    (25,   100,  250,  500),    # IL 1
+    (50,   250,  500,  1000),   # IL 2
+    (100,  500,  1000, 2500),   # IL 3
+    (250,  1000, 2500, 10000),  # IL 4
+)
+# Design life not in the table: R by importance level only (IL 4 and above -> 2000)
+_RETURN_PERIOD_FALLBACK = {1: 100, 2: 500, 3: 1000}
+
+@lru_cache(maxsize=256)
 def get_return_period(importance_level, design_life):
-    lookup = {
-        (1, 5): 25,   (1, 25): 100,  (1, 50): 250,  (1, 100): 500,
-        (2, 5): 50,   (2, 25): 250,  (2, 50): 500,  (2, 100): 1000,
-        (3, 5): 100,  (3, 25): 500,  (3, 50): 1000, (3, 100): 2500,
-        (4, 5): 250,  (4, 25): 1000, (4, 50): 2500, (4, 100): 10000
-    }
-    if (importance_level, design_life) in lookup:
-        return lookup[(importance_level, design_life)]
-    if importance_level == 1: return 100
-    elif importance_level == 2: return 500
-    elif importance_level == 3: return 1000
-    else: return 2000
+    row = _IL_ROW.get(importance_level)
+    col = _DESIGN_LIFE_COL.get(design_life)
+    if row is not None and col is not None:
+        return _RETURN_PERIOD_TABLE[row][col]
+    return _RETURN_PERIOD_FALLBACK.get(importance_level, 2000)
 
+@lru_cache(maxsize=256)
 def get_vr_from_ari(region, ret_period):
-    if region not in WIND_DATA:
+    row = _REGION_ROW.get(region)
+    if row is None:
         return 45.0 
-    data = WIND_DATA[region]
-    if ret_period in data:
-        return float(data[ret_period])
-    sorted_years = sorted(data.keys())
-    for yr in sorted_years:
-        if yr >= ret_period:
-            return float(data[yr])
-    return float(data[sorted_years[-1]])
+    # First tabulated R >= ret_period, capped at the largest R
+    idx = min(bisect_left(_WIND_R_TUPLE, ret_period), len(_WIND_R_TUPLE) - 1)
+    return _WIND_VR_ROWS[row][idx]
 
+def get_vr_from_ari_batch(region, ret_periods):
+    # Vectorized get_vr_from_ari: one searchsorted over an array of return periods
+    ret_periods = np.asarray(ret_periods)
+    row = _REGION_ROW.get(region)
+    if row is None:
+        return np.full(ret_periods.shape, 45.0, dtype=_WIND_VR_TABLE.dtype)
+    idx = np.minimum(np.searchsorted(_WIND_R, ret_periods), len(_WIND_R) - 1)
+    return _WIND_VR_TABLE[row, idx]
+
+@lru_cache(maxsize=512)
 def get_mz_cat(height, terrain_category):
     h = max(height, 3.0)
     if terrain_category <= 1.0:
@@ -73,27 +106,68 @@ def get_mz_cat(height, terrain_category):
         if h <= 20: return 0.75
         return 0.75 + 0.10 * math.log10(h/20)
 
+def get_mz_cat_batch(heights, terrain_category):
+    # Vectorized get_mz_cat over an array of heights - same steps per terrain category
+    h = np.maximum(np.asarray(heights, dtype=float), 3.0)
+    if terrain_category <= 1.0:
+        return np.where(h <= 5, 1.12, 1.05 + 0.05 * np.log(h))
+    elif terrain_category <= 2.0:
+        return np.where(h <= 5, 0.91, np.where(h <= 10, 1.00, 1.0 + 0.15 * np.log10(h/10)))
+    elif terrain_category <= 2.5:
+        return np.where(h <= 5, 0.87, np.where(h <= 10, 0.92, 0.92 + 0.13 * np.log10(h/10)))
+    elif terrain_category <= 3.0:
+        return np.where(h <= 10, 0.83, np.where(h <= 15, 0.89, 0.83 + 0.15 * np.log10(h/10)))
+    else:
+        return np.where(h <= 20, 0.75, 0.75 + 0.10 * np.log10(h/20))
+
 def calculate_v_des_detailed(vr, md, mz_cat, ms, mt):
     return vr * md * (mz_cat * ms * mt)
 
+# 0.5 * rho_air / 1000 (rho_air = 1.2 kg/m^3): V^2 in (m/s)^2 -> q in kPa
+_Q_KPA = 0.5 * 1.2 / 1000.0
+
 def calculate_wind_pressure(v_des, c_fig, ka=1.0, kc=1.0, kl=1.0, p_dyn_factor=1.0):
-    rho_air = 1.2
-    q_z = 0.5 * rho_air * (v_des ** 2)
-    p_design = q_z * c_fig * ka * kc * kl * p_dyn_factor
-    return p_design / 1000.0
+    # Plain arithmetic: any argument may be a NumPy array (e.g. Kl for all zones at once)
+    # Sign (pressure/suction) comes from c_fig - coefficients are combined first
+    return _Q_KPA * (v_des * v_des) * (c_fig * ka * kc * kl * p_dyn_factor)
 
 def calculate_tributary_width(panel_w, panel_d, orientation='width'):
     if orientation == 'width': return panel_d / 2.0
     else: return panel_w / 2.0
 
+@lru_cache(maxsize=None)
+def _roof_family(roof_type):
+    # Normalize a roof label (e.g. "Gable Roof") to its family once per distinct label
+    if "Monoslope" in roof_type: return "Monoslope"
+    if "Gable" in roof_type: return "Gable"
+    return None
+
+class CpeResult(NamedTuple):
+    cpe: float
+    notes: str
+
+@lru_cache(maxsize=256)
 def solve_cpe_for_ratio(roof_angle, roof_type, h_d_ratio):
+    # Immutable result - safe to hand the cached object to every caller
     cpe = -0.9 
-    if "Monoslope" in roof_type:
+    family = _roof_family(roof_type)
+    if family == "Monoslope":
         if roof_angle < 10: cpe = -1.2
         elif roof_angle < 20: cpe = -1.4
         else: cpe = -1.1
-    elif "Gable" in roof_type:
+    elif family == "Gable":
         if roof_angle < 10: cpe = -0.9 if h_d_ratio < 0.5 else -1.3
         elif roof_angle < 20: cpe = -0.7 if h_d_ratio < 0.5 else -0.9
         else: cpe = -0.6
-    return {'cpe': cpe, 'notes': 'Simplified look-up'}
+    return CpeResult(cpe, 'Simplified look-up')
+
+def solve_cpe_for_ratio_batch(roof_angles, roof_type, h_d_ratios):
+    # Vectorized Cpe look-up over arrays of roof angles / h/d ratios (same steps as solve_cpe_for_ratio)
+    angles, ratios = np.broadcast_arrays(np.asarray(roof_angles, dtype=float), np.asarray(h_d_ratios, dtype=float))
+    family = _roof_family(roof_type)
+    if family == "Monoslope":
+        return np.select([angles < 10, angles < 20], [-1.2, -1.4], -1.1)
+    if family == "Gable":
+        low = ratios < 0.5
+        return np.select([angles < 10, angles < 20], [np.where(low, -0.9, -1.3), np.where(low, -0.7, -0.9)], -0.6)
+    return np.full(angles.shape, -0.9)